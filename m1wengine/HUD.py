@@ -17,6 +17,10 @@ class HeadsUpDisplay(pygame.sprite.Group):
         The current score for the game
     _boredom_meter: int
         The current boredom meter for the game
+    _box_cache: dict[tuple[int, int], pygame.Surface]
+        The filled box surface of each box size, shared by every box
+    _premultiplied: set[pygame.sprite.Sprite]
+        The sprites whose images have premultiplied alpha
 
     Methods
     -------
@@ -34,6 +38,10 @@ class HeadsUpDisplay(pygame.sprite.Group):
         Attempt to close out the level prompt
     add_box(self, rect, height, width) -> pygame.sprite.Sprite
         Add a box to the HUD
+    add_panel(self, box, labels) -> pygame.sprite.Sprite
+        Bake a box and the labels drawn over it into one sprite
+    draw(self, surface, bgsurf=None, special_flags=0) -> list[pygame.Rect]
+        Draw every sprite, blending premultiplied sprites as such
     update(self)
         Update sprites on the HUD
     add_level_hint(self)
@@ -64,6 +72,10 @@ class HeadsUpDisplay(pygame.sprite.Group):
     PAUSE_BUTTON_HEIGHT = 30
 
     BOX_ALPHA = 100
+    # grey at BOX_ALPHA, parsed once and shared by every box
+    BOX_COLOR = pygame.Color(*pygame.Color("grey")[:3], BOX_ALPHA)
+
+    _box_cache: dict[tuple[int, int], pygame.Surface] = {}
 
     def __new__(cls):
         """Create a singleton object.
@@ -75,16 +87,37 @@ class HeadsUpDisplay(pygame.sprite.Group):
         return cls.instance
 
     def __init__(self):
-        """Construct the first singleton instance."""
+        """Construct the first singleton instance.
+
+        Every HeadsUpDisplay() call runs __init__ on the singleton, so later calls
+        return straight away instead of rebuilding the HUD sprites.
+        """
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized: bool = True
         super().__init__()
         self._score: ScoreController = ScoreController()
         self._show_level_hint: bool = False
         self._level_hint_added_flag: bool = False
         self._level_hint_text: str = ""
         self._level_paused: bool = False
-        self._level_hint_txt_sprite = pygame.sprite.Sprite()
-        self._level_box_sprite = pygame.sprite.Sprite()
         self.level_prompt_timer = 0
+        self._premultiplied: set[pygame.sprite.Sprite] = set()
+
+        # the level hint sprites are made once and added while a hint is shown
+        hint_x: int = self.LEVEL_HINT_BOX_X_PX
+        hint_y: int = self.LEVEL_HINT_BOX_Y_PX
+        hint_width: int = self.LEVEL_HINT_BOX_WIDTH
+        hint_height: int = self.LEVEL_HINT_BOX_HEIGHT
+        level_hint_rect: pygame.Rect = pygame.Rect(
+            hint_x, hint_y, hint_width, hint_height
+        )
+        self._level_box_sprite: pygame.sprite.Sprite = self.add_box(
+            level_hint_rect, hint_width, hint_height
+        )
+        self._level_hint_txt_sprite: Text = Text(
+            hint_x, hint_y + 10, self._level_hint_text
+        )
 
         self.init_score_info()
 
@@ -100,34 +133,31 @@ class HeadsUpDisplay(pygame.sprite.Group):
 
     def init_score_info(self) -> None:
         """Initialize the score information area."""
-        score_rect: pygame.Rect = pygame.Rect(
-            self.SCORE_BOX_X_PX,
-            self.SCORE_BOX_Y_PX,
-            self.SCORE_BOX_WIDTH,
-            self.SCORE_BOX_HEIGHT,
-        )
-        self.add(self.add_box(score_rect, self.SCORE_BOX_HEIGHT, self.SCORE_BOX_WIDTH))
-        self.__current_score_sprite: Text = Text(
-            self.SCORE_BOX_X_PX,
-            self.SCORE_BOX_Y_PX,
-            "Current Score:",
-        )
-        self.add(self.__current_score_sprite)
-        self.__boredom_meter_spr: Text = Text(
-            self.SCORE_BOX_X_PX,
-            self.SCORE_BOX_Y_PX + 20,
-            "Boredom Meter:",
+        # read the layout constants once rather than per use
+        box_x: int = self.SCORE_BOX_X_PX
+        box_y: int = self.SCORE_BOX_Y_PX
+        box_height: int = self.SCORE_BOX_HEIGHT
+        box_width: int = self.SCORE_BOX_WIDTH
+
+        score_rect: pygame.Rect = pygame.Rect(box_x, box_y, box_width, box_height)
+        score_box: pygame.sprite.Sprite = self.add_box(
+            score_rect, box_height, box_width
         )
-        self.add(self.__boredom_meter_spr)
+        score_labels: list[Text] = [
+            Text(box_x, box_y, "Current Score:"),
+            Text(box_x, box_y + 20, "Boredom Meter:"),
+        ]
+        # the box and labels never change, draw them as a single sprite
+        self.add(self.add_panel(score_box, score_labels))
         self.__current_score_value_sprite: Text = Text(
             self.SCORE_BOX_VALUE_X_SCORE,
-            self.SCORE_BOX_Y_PX + 1,
+            box_y + 1,
             str(self._score.current_score),
         )
         self.add(self.__current_score_value_sprite)
         self.__boredom_meter_value_sprite: Text = Text(
             self.SCORE_BOX_VALUE_X_BOREDOM,
-            self.SCORE_BOX_Y_PX + 21,
+            box_y + 21,
             str(self._score.boredom_meter),
         )
         self.add(self.__boredom_meter_value_sprite)
@@ -149,14 +179,109 @@ class HeadsUpDisplay(pygame.sprite.Group):
             self.display_level_hint = False
 
     def add_box(self, rect, height, width) -> pygame.sprite.Sprite:
-        """Create a background box for HUD elements."""
+        """Create a background box for HUD elements.
+
+        Boxes of the same size share one filled surface, which is never drawn on.
+        The transparency is baked into the pixels of a surface in the display
+        alpha format, so the box blits with a single per pixel alpha blend. The
+        display mode must be set before the first box is made.
+        """
         sprite: pygame.sprite.Sprite = pygame.sprite.Sprite()
         sprite.rect = rect
-        sprite.image = pygame.Surface((height, width))
-        sprite.image.fill(pygame.Color("grey"))
-        sprite.image.set_alpha(self.BOX_ALPHA)
+        size: tuple[int, int] = (height, width)
+        if size not in self._box_cache:
+            box_image: pygame.Surface = pygame.Surface(
+                size, pygame.SRCALPHA
+            ).convert_alpha()
+            box_image.fill(self.BOX_COLOR)
+            self._box_cache[size] = box_image
+        sprite.image = self._box_cache[size]
         return sprite
 
+    def add_panel(
+        self, box: pygame.sprite.Sprite, labels: list[Text]
+    ) -> pygame.sprite.Sprite:
+        """Bake a background box and the labels drawn over it into one sprite.
+
+        The box and labels are composited with premultiplied alpha, which blends
+        the labels over the translucent box the same way they blend over it on
+        screen. A straight alpha blit onto a translucent surface does not. The
+        panel is drawn with BLEND_PREMULTIPLIED by draw.
+
+        Parameters
+        ----------
+        box: pygame.sprite.Sprite
+            The box made by add_box
+        labels: list[Text]
+            The text that never changes drawn over the box
+
+        Returns
+        -------
+        panel: pygame.sprite.Sprite
+            The sprite holding the box and labels
+        """
+        panel: pygame.sprite.Sprite = pygame.sprite.Sprite()
+        panel.rect = box.image.get_rect(topleft=box.rect.topleft).unionall(
+            [label.image.get_rect(topleft=label.rect.topleft) for label in labels]
+        )
+        panel.image = pygame.Surface(panel.rect.size, pygame.SRCALPHA).convert_alpha()
+
+        panel.image.blit(
+            box.image.premul_alpha(), box.rect.move(-panel.rect.x, -panel.rect.y)
+        )
+        for label in labels:
+            panel.image.blit(
+                label.image.convert_alpha().premul_alpha(),
+                label.rect.move(-panel.rect.x, -panel.rect.y),
+                special_flags=pygame.BLEND_PREMULTIPLIED,
+            )
+        self._premultiplied.add(panel)
+        return panel
+
+    def draw(
+        self, surface: pygame.Surface, bgsurf=None, special_flags: int = 0
+    ) -> list[pygame.Rect]:
+        """Draw every HUD sprite with a single blits call.
+
+        Sprites made by add_panel are blended as premultiplied alpha, every other
+        sprite uses special_flags.
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            The surface to draw onto
+        bgsurf: pygame.Surface
+            Unused, kept to match pygame.sprite.Group.draw
+        special_flags: int
+            The blend flags used when drawing the other sprites
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The dirty rects, always empty as in pygame.sprite.Group.draw
+        """
+        sprites: list[pygame.sprite.Sprite] = self.sprites()
+        self.spritedict.update(
+            zip(
+                sprites,
+                surface.blits(
+                    [
+                        (
+                            sprite.image,
+                            sprite.rect,
+                            None,
+                            pygame.BLEND_PREMULTIPLIED
+                            if sprite in self._premultiplied
+                            else special_flags,
+                        )
+                        for sprite in sprites
+                    ]
+                ),
+            )
+        )
+        self.lostsprites = []
+        return self.lostsprites
+
     def update(self):
         """Run the HUD."""
         super().update()
@@ -170,24 +295,8 @@ class HeadsUpDisplay(pygame.sprite.Group):
         if self._show_level_hint:
             if not self._level_hint_added_flag:
                 self._level_hint_added_flag = True
-
-                level_hint_rect: pygame.Rect = pygame.Rect(
-                    self.LEVEL_HINT_BOX_X_PX,
-                    self.LEVEL_HINT_BOX_Y_PX,
-                    self.LEVEL_HINT_BOX_WIDTH,
-                    self.LEVEL_HINT_BOX_HEIGHT,
-                )
-                self._level_box_sprite: pygame.sprite.Sprite = self.add_box(
-                    level_hint_rect,
-                    self.LEVEL_HINT_BOX_WIDTH,
-                    self.LEVEL_HINT_BOX_HEIGHT,
-                )
+                self._level_hint_txt_sprite.text_string = self._level_hint_text
                 self.add(self._level_box_sprite)
-                self._level_hint_txt_sprite: Text = Text(
-                    self.LEVEL_HINT_BOX_X_PX,
-                    self.LEVEL_HINT_BOX_Y_PX + 10,
-                    str(self._level_hint_text),
-                )
                 self.add(self._level_hint_txt_sprite)
         else:
             # remove level hint prompt sprites
@@ -32,7 +32,7 @@ class Button(pygame.sprite.Sprite):
         Rect to store button position
     __text: Text
         Object holding the Text
-    __fill_colors: dict[str, str]
+    __fill_colors: dict[str, pygame.Color]
         What colors the button can have
 
     Methods
@@ -86,10 +86,11 @@ class Button(pygame.sprite.Sprite):
         )
         self.__text: Text = Text(x, y, button_text)
 
-        self.__fill_colors: dict[str, str] = {
-            "normal": "#ffffff",
-            "hover": "#666666",
-            "pressed": "#333333",
+        # parsed once here instead of on every fill
+        self.__fill_colors: dict[str, pygame.Color] = {
+            "normal": pygame.Color("#ffffff"),
+            "hover": pygame.Color("#666666"),
+            "pressed": pygame.Color("#333333"),
         }
 
     def update(self):
@@ -107,5 +108,5 @@ class Button(pygame.sprite.Sprite):
                     self.__already_pressed = True
             else:
                 self.__already_pressed = False
-        self.__text.render_font()
+        # the label is rendered once by Text, only the fill changes per frame
         self.image.blit(self.__text.image, (0, 0))
@@ -1,7 +1,36 @@
 """This module contains the SpriteSheet class."""
+from functools import cache
 import pygame
 
 
+@cache
+def _load_sheet(image_path: str) -> pygame.Surface:
+    """Load a sprite sheet once in the display pixel format.
+
+    Parameters
+    ----------
+    image_path: str
+        The path to the image to load
+
+    Returns
+    -------
+    pygame.Surface
+        The converted sheet, shared by every SpriteSheet using the path
+
+    Raises
+    ------
+    pygame.error: the display mode must be set before a sheet is loaded
+    """
+    # convert needs a display mode to know the screen pixel format
+    if pygame.display.get_surface() is None:
+        raise pygame.error("ERROR: set the display mode before loading a sprite sheet.")
+    try:
+        return pygame.image.load(image_path).convert()
+    except pygame.error as e:
+        print(f"Unable to load spritesheet image: {image_path}")
+        raise SystemExit(e)
+
+
 class SpriteSheet:
     """This class handles sprite sheets.
 
@@ -14,6 +43,8 @@ class SpriteSheet:
         The background color for the sprite
     _sheet: pygame.Surface
         The animation sheet to display
+    _image_cache: dict[tuple, pygame.Surface]
+        The images already cut from the sheet, keyed by their rect
     """
 
     def __init__(
@@ -21,25 +52,34 @@ class SpriteSheet:
     ) -> None:
         """Load the sheet.
 
+        Each image path is only loaded and converted once. Every entity sharing a
+        sheet reuses the same surface.
+
         file_name: str
             The path to the image to load
         color_key: pygame.Color | Tuple
             The color to make the background transparent
+
+        Raises
+        ------
+        pygame.error: the display mode must be set before a sheet is loaded
         """
         if isinstance(color_key, pygame.Color):
             self._color_key: tuple = (color_key.r, color_key.g, color_key.b)
         else:
             self._color_key: pygame.Color = color_key
+        self._image_cache: dict[tuple, pygame.Surface] = {}
         if image_path:
-            try:
-                self._sheet: pygame.Surface = pygame.image.load(image_path).convert()
-            except pygame.error as e:
-                print(f"Unable to load spritesheet image: {image_path}")
-                raise SystemExit(e)
+            self._sheet: pygame.Surface = _load_sheet(image_path)
 
     def image_at(self, rectangle: tuple) -> pygame.Surface:
         """Load a specific image from a specific rectangle.
 
+        Images are cached by rect, so the same surface is returned every time a
+        rect is loaded. Rects inside the sheet are returned as subsurfaces which
+        share the sheet's pixels, so callers must copy the image before drawing
+        onto it.
+
         Parameters
         ----------
         rectangle: tuple
@@ -56,10 +96,19 @@ class SpriteSheet:
         """
         # Loads image from x, y, x+offset, y+offset.
         rect: pygame.Rect = pygame.Rect(rectangle)
-        image: pygame.Surface = pygame.Surface(rect.size)
+        cached_image: pygame.Surface = self._image_cache.get(tuple(rect))
+        if cached_image is not None:
+            return cached_image
+
         if self._sheet:
-            image.blit(self._sheet, (0, 0), rect)
+            if self._sheet.get_rect().contains(rect):
+                image: pygame.Surface = self._sheet.subsurface(rect)
+            else:
+                # subsurfaces cannot extend past the sheet, copy the clipped part
+                image: pygame.Surface = pygame.Surface(rect.size).convert()
+                image.blit(self._sheet, (0, 0), rect)
             image.set_colorkey(self._color_key)
+            self._image_cache[tuple(rect)] = image
             return image
         else:
             raise ValueError("ERROR: No sprite sheet was set!")
@@ -94,8 +143,8 @@ class SpriteSheet:
         list[pygame.Surface]
             All loaded images as a list
         """
+        left, top, width, height = rect
         tuples: list[tuple] = [
-            (rect[0] + rect[2] * x, rect[1], rect[2], rect[3])
-            for x in range(image_count)
+            (left + width * x, top, width, height) for x in range(image_count)
         ]
         return self.images_at(tuples)
@@ -1,13 +1,23 @@
 """This module contains methods to load game assets."""
 from csv import reader
+from functools import cache
+from itertools import zip_longest
 from os import walk
 import pygame
 from m1wengine.settings import TILESIZE
 
+# layout value of a cell without a tile
+EMPTY_TILE = -1
 
-def import_csv_layout(path: str) -> list[int]:
+
+@cache
+def import_csv_layout(path: str) -> tuple[tuple[int, ...], ...]:
     """Read in csv values into an array.
 
+    Values are parsed to int once here so layouts are never compared or
+    indexed with strings. Each path is only read once and later calls return the
+    same layout, which is made of tuples so it cannot be changed by a caller.
+
     Parameters
     ----------
     path: str
@@ -15,15 +25,114 @@ def import_csv_layout(path: str) -> list[int]:
 
     Returns
     -------
-    list[int]
-        The list of Tile values that represent the map layout
+    tuple[tuple[int, ...], ...]
+        The rows of Tile values that represent the map layout
     """
-    terrain_map: list = []
     with open(path) as level_map:
         layout = reader(level_map, delimiter=",")
-        for row in layout:
-            terrain_map.append(list(row))
-        return terrain_map
+        return tuple(tuple(int(value) for value in row) for row in layout)
+
+
+def _scan_layers(
+    layouts: list[tuple[tuple[int, ...], ...]]
+) -> list[tuple[tuple[int, int], int]]:
+    """Get the position and value of every tile in a stack of layouts.
+
+    This is the one scan every layout helper is built on. Every cell is visited
+    once for all layers, and the tiles of a cell are ordered from the first
+    layout to the last.
+
+    Parameters
+    ----------
+    layouts: list[tuple[tuple[int, ...], ...]]
+        The layouts returned by import_csv_layout, from the bottom layer up
+
+    Returns
+    -------
+    list[tuple[tuple[int, int], int]]
+        The (x, y) pixel position and layout value of each tile
+    """
+    return [
+        ((col * TILESIZE, row * TILESIZE), value)
+        for row, layer_rows in enumerate(zip_longest(*layouts, fillvalue=()))
+        for col, values in enumerate(zip_longest(*layer_rows, fillvalue=EMPTY_TILE))
+        for value in values
+        if value != EMPTY_TILE
+    ]
+
+
+def get_layout_tiles(
+    layout: tuple[tuple[int, ...], ...]
+) -> list[tuple[tuple[int, int], int]]:
+    """Get the position and value of every cell in a layout that has a tile.
+
+    The layout is scanned once, so callers only iterate over the cells that
+    hold a tile instead of every cell of the map.
+
+    Parameters
+    ----------
+    layout: tuple[tuple[int, ...], ...]
+        The layout returned by import_csv_layout
+
+    Returns
+    -------
+    list[tuple[tuple[int, int], int]]
+        The (x, y) pixel position and layout value of each tile
+    """
+    return _scan_layers([layout])
+
+
+def get_layout_entities(
+    layout: tuple[tuple[int, ...], ...], entity_keys: dict[str, int]
+) -> dict[str, list[tuple[int, int]]]:
+    """Group the position of every entity in a layout by entity name.
+
+    The layout is scanned once for all entity kinds, so spawning code only loops
+    over the entities that exist and never rescans the layout per kind.
+
+    Parameters
+    ----------
+    layout: tuple[tuple[int, ...], ...]
+        The layout returned by import_csv_layout
+    entity_keys: dict[str, int]
+        The layout value of each entity name, such as character_keys
+
+    Returns
+    -------
+    dict[str, list[tuple[int, int]]]
+        The (x, y) pixel positions of each entity name
+    """
+    names_by_value: dict[int, str] = {
+        value: name for name, value in entity_keys.items()
+    }
+    entities: dict[str, list[tuple[int, int]]] = {name: [] for name in entity_keys}
+    for position, value in get_layout_tiles(layout):
+        name: str = names_by_value.get(value)
+        if name is not None:
+            entities[name].append(position)
+    return entities
+
+
+def get_layout_blits(
+    layout: tuple[tuple[int, ...], ...], tile_surfaces: list[pygame.Surface]
+) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+    """Get the blit sequence of every tile in a layout.
+
+    Used for tiles that are only drawn, so no Tile sprite is made per cell.
+
+    Parameters
+    ----------
+    layout: tuple[tuple[int, ...], ...]
+        The layout returned by import_csv_layout
+    tile_surfaces: list[pygame.Surface]
+        The tile images indexed by layout value
+
+    Returns
+    -------
+    list[tuple[pygame.Surface, tuple[int, int]]]
+        The image and (x, y) pixel position of each tile
+    """
+    return get_layers_blits([layout], tile_surfaces)
 
 
 def import_folder(path: str) -> None:
@@ -46,6 +155,11 @@ def import_folder(path: str) -> None:
 def import_cut_graphic(path: str) -> list[pygame.Surface]:
     """Cut a tileset into correct sprites.
 
+    The tileset is flattened onto a single atlas surface in the display pixel
+    format with a black colorkey, and every tile is a subsurface of that atlas.
+    All tiles share one block of pixels and blitting a tile never has to convert
+    pixels.
+
     Parameters
     ----------
     path: str
@@ -57,16 +171,45 @@ def import_cut_graphic(path: str) -> list[pygame.Surface]:
         The list of images extracted from a larger image
     """
     surface: pygame.Surface = pygame.image.load(path).convert_alpha()
-    tile_num_x: int = int(surface.get_size()[0] / TILESIZE)
-    tile_num_y: int = int(surface.get_size()[1] / TILESIZE)
+    surface_width, surface_height = surface.get_size()
+    tile_num_x: int = int(surface_width / TILESIZE)
+    tile_num_y: int = int(surface_height / TILESIZE)
+
+    # transparent pixels become black, which the colorkey hides again
+    atlas: pygame.Surface = pygame.Surface(surface.get_size()).convert()
+    atlas.blit(surface, (0, 0))
+    atlas.set_colorkey(pygame.Color("black"))
 
     cut_tiles: list = []
     for row in range(tile_num_y):
         for col in range(tile_num_x):
             x: int = col * TILESIZE
             y: int = row * TILESIZE
-            new_surface: pygame.Surface = pygame.Surface((TILESIZE, TILESIZE))
             new_rect: pygame.Rect = pygame.Rect(x, y, TILESIZE, TILESIZE)
-            new_surface.blit(surface, (0, 0), new_rect)
-            cut_tiles.append(new_surface)
+            cut_tiles.append(atlas.subsurface(new_rect))
     return cut_tiles
+
+
+def get_layers_blits(
+    layouts: list[tuple[tuple[int, ...], ...]], tile_surfaces: list[pygame.Surface]
+) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+    """Get the blit sequence of every tile in a stack of layouts in one pass.
+
+    Tiles are one cell in size and never overlap other cells, so drawing the
+    sequence gives the same result as drawing each layout in turn.
+
+    Parameters
+    ----------
+    layouts: list[tuple[tuple[int, ...], ...]]
+        The layouts returned by import_csv_layout, from the bottom layer up
+    tile_surfaces: list[pygame.Surface]
+        The tile images indexed by layout value
+
+    Returns
+    -------
+    list[tuple[pygame.Surface, tuple[int, int]]]
+        The image and (x, y) pixel position of each tile
+    """
+    return [
+        (tile_surfaces[value], position) for position, value in _scan_layers(layouts)
+    ]
@@ -26,11 +26,11 @@ menu_data = {
 }
 
 character_keys = {
-    "player": "1242",
-    "damsel": "1243",
-    "skeleton": "1241",
-    "minotaur": "1178",
-    "postman": "1180",
+    "player": 1242,
+    "damsel": 1243,
+    "skeleton": 1241,
+    "minotaur": 1178,
+    "postman": 1180,
 }
 
-item_keys = {"crystal": "1301"}
+item_keys = {"crystal": 1301}
@@ -1,6 +1,7 @@
 """AssetManager class."""
 import pygame
 from m1wengine.file_managers.support import import_cut_graphic
+from m1wengine.settings import LOOP_MUSIC
 from game_data import level_data, menu_data
 
 
@@ -41,10 +42,14 @@ class AssetManager:
         return self._univeral_sprites
 
     def load_music(self, menu_flag: str, key: str) -> None:
-        """Unload previous music and loads menu music."""
+        """Unload previous music and loads menu music.
+
+        The previous track is unloaded straight away instead of waiting for a
+        fadeout, so switching music never stalls the game loop.
+        """
         self._music_manager.music.unload()
         if menu_flag == "menu":
             self._music_manager.music.load(menu_data.get(key).get("music"))
         else:
             self._music_manager.music.load(level_data.get(key).get("music"))
-        self._music_manager.music.play()
+        self._music_manager.music.play(LOOP_MUSIC)
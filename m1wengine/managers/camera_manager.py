@@ -1,6 +1,8 @@
 """This module contains the CameraManager class."""
+import itertools
 import pygame
 from m1wengine.tiles.entities.characters.player import Player
+from m1wengine.tiles.tile import Tile
 
 
 class CameraManager(pygame.sprite.Group):
@@ -20,11 +22,37 @@ class CameraManager(pygame.sprite.Group):
         The offset at which to render all sprites
     _player_character: Player
         The currently shown frame represented by an index
+    _static_anchor: Tile
+        Empty tile moved by the camera in place of every static tile
+    _static_blit_sequence: list[tuple[pygame.Surface, tuple[int, int]]]
+        The image and anchor relative position of every static tile
+    _static_background: pygame.Surface
+        Every static tile composited onto a single surface
+    _static_background_rect: pygame.Rect
+        The anchor relative bounds of the static background
 
     Methods
     -------
     camera_update(self)
         Renders all sprites relative to the player character position
+    add_static_tiles(self, *tile_groups: pygame.sprite.Group)
+        Bake tiles that never move on their own into the static background
+    add_static_blits(
+        self, *blit_sequences: list[tuple[pygame.Surface, tuple[int, int]]]
+    )
+        Bake images that never move on their own into the static background
+    draw(self, surface: pygame.Surface) -> list[pygame.Rect]
+        Draw the static tiles followed by every sprite in the camera
+    _bake_static_background(self)
+        Composite every static tile onto the static background
+    _clear_margins(
+        self, surface: pygame.Surface, viewport: pygame.Rect, covered: pygame.Rect
+    )
+        Fill the part of the viewport the static background does not cover
+    _move_against_player(
+        self, sprite: Tile, camera_compass: pygame.math.Vector2, speed: int
+    )
+        Move a sprite in the opposite direction of the player's heading
     """
 
     def __init__(self, player_character: Player) -> None:
@@ -39,19 +67,21 @@ class CameraManager(pygame.sprite.Group):
             The player character that entities move around
         """
         super().__init__()
-        surface_x: int = 0
-        surface_y: int = 1
         display_surface: pygame.Surface = pygame.display.get_surface()
-        self._half_width: int = (
-            display_surface.get_size()[surface_x] // 2
-        )  # floor division, returns int
-        self._half_height: int = (
-            display_surface.get_size()[surface_y] // 2
-        )  # floor division, returns int
+        surface_width, surface_height = display_surface.get_size()
+        # floor division, returns int
+        self._half_width: int = surface_width // 2
+        self._half_height: int = surface_height // 2
 
         self._offset: pygame.math.Vector2 = pygame.math.Vector2()
         self._player_character: Player = player_character
 
+        # static tiles are drawn relative to this tile instead of being moved
+        self._static_anchor: Tile = Tile(())
+        self._static_blit_sequence: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._static_background: pygame.Surface = pygame.Surface((0, 0))
+        self._static_background_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+
     def camera_update(self) -> None:
         """Update the camera sprites.
 
@@ -60,12 +90,199 @@ class CameraManager(pygame.sprite.Group):
         Note that non-player entities will move at a slower speed than the player
         due to being moved in the opposite direction of the player at the
         player's speed.
+        Nothing is moved while the player is standing still, and sprites are moved
+        in group order since each move is independent of the others.
+        """
+        player: Player = self._player_character
+        if player.speed == 0 or not player.compass:
+            return
+
+        # one heading for the whole frame, shared by every moved sprite
+        camera_compass: pygame.math.Vector2 = player.compass * -1
+        for sprite in self.sprites():
+            self._move_against_player(sprite, camera_compass, player.speed)
+        self._move_against_player(self._static_anchor, camera_compass, player.speed)
+
+    def add_static_tiles(self, *tile_groups: pygame.sprite.Group) -> None:
+        """Cache the blit sequence of tiles that never move on their own.
+
+        Static tiles are not added to the camera group, so camera_update never
+        touches them. See add_static_blits.
+
+        Parameters
+        ----------
+        tile_groups: pygame.sprite.Group
+            The groups of background tiles to draw with the camera
+        """
+        self.add_static_blits(
+            [(tile.image, tile.rect.topleft) for tile in itertools.chain(*tile_groups)]
+        )
+
+    def add_static_blits(
+        self, *blit_sequences: list[tuple[pygame.Surface, tuple[int, int]]]
+    ) -> None:
+        """Cache images that never move on their own.
+
+        Positions are stored relative to the static anchor and the images are
+        baked into a single background surface which is translated by the anchor
+        position when drawn. Layers created with get_layout_blits can be added
+        without making a Tile sprite for every cell.
+
+        Parameters
+        ----------
+        blit_sequences: list[tuple[pygame.Surface, tuple[int, int]]]
+            The image and (x, y) position of each background tile
+        """
+        anchor_x, anchor_y = self._static_anchor.rect.topleft
+        self._static_blit_sequence.extend(
+            (image, (x - anchor_x, y - anchor_y))
+            for image, (x, y) in itertools.chain(*blit_sequences)
+        )
+        self._bake_static_background()
+
+    def draw(
+        self, surface: pygame.Surface, bgsurf=None, special_flags: int = 0
+    ) -> list[pygame.Rect]:
+        """Draw the static tiles followed by every sprite in the camera.
+
+        The static tiles are drawn with a single blit of the part of the static
+        background that is inside the surface, and only the margins it does not
+        cover are filled black. When static tiles are set callers do not need to
+        fill the surface first. Camera sprites whose image is outside of the surface
+        are skipped.
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            The surface to draw onto
+        bgsurf: pygame.Surface
+            Unused, kept to match pygame.sprite.Group.draw
+        special_flags: int
+            The blend flags used when drawing the camera sprites
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The dirty rects, always empty as in pygame.sprite.Group.draw
         """
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-            # offset = sprite.rect.topleft - self.offset
-            previous_direction: pygame.math.Vector2 = sprite.compass.copy()
-            sprite.compass = self._player_character.compass.copy() * -1
-            sprite.move(self._player_character.speed)
-            sprite.compass = pygame.math.Vector2(
-                previous_direction.x, previous_direction.y
+        viewport: pygame.Rect = surface.get_rect()
+        background_rect: pygame.Rect = self._static_background_rect.move(
+            self._static_anchor.rect.topleft
+        )
+        visible_rect: pygame.Rect = background_rect.clip(viewport)
+        if visible_rect:
+            surface.blit(
+                self._static_background,
+                visible_rect,
+                visible_rect.move(-background_rect.x, -background_rect.y),
             )
+        if self._static_blit_sequence and visible_rect != viewport:
+            self._clear_margins(surface, viewport, visible_rect)
+
+        sprites: list[pygame.sprite.Sprite] = self.sprites()
+        # cull by the drawn image, rotated images are larger than the sprite rect
+        image_rects: list[pygame.Rect] = [
+            sprite.image.get_rect(topleft=sprite.rect.topleft) for sprite in sprites
+        ]
+        visible_sprites: list[pygame.sprite.Sprite] = [
+            sprites[index] for index in viewport.collidelistall(image_rects)
+        ]
+        self.spritedict.update(
+            zip(
+                visible_sprites,
+                surface.blits(
+                    [
+                        (sprite.image, sprite.rect, None, special_flags)
+                        for sprite in visible_sprites
+                    ]
+                ),
+            )
+        )
+        self.lostsprites = []
+        return self.lostsprites
+
+    def _bake_static_background(self) -> None:
+        """Composite every static tile onto the static background.
+
+        Uncovered parts of the background are left black. The background is
+        opaque so it replaces clearing the screen each frame.
+        """
+        tile_rects: list[pygame.Rect] = [
+            image.get_rect(topleft=position)
+            for image, position in self._static_blit_sequence
+        ]
+        if not tile_rects:
+            return
+        bounds: pygame.Rect = tile_rects[0].unionall(tile_rects[1:])
+
+        background: pygame.Surface = pygame.Surface(bounds.size).convert()
+        background.blits(
+            [
+                (image, (x - bounds.x, y - bounds.y))
+                for image, (x, y) in self._static_blit_sequence
+            ],
+            doreturn=False,
+        )
+        self._static_background = background
+        self._static_background_rect = bounds
+
+    def _clear_margins(
+        self, surface: pygame.Surface, viewport: pygame.Rect, covered: pygame.Rect
+    ) -> None:
+        """Fill the part of the viewport the static background does not cover.
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            The surface being drawn onto
+        viewport: pygame.Rect
+            The rect of the whole surface
+        covered: pygame.Rect
+            The part of the viewport covered by the static background
+        """
+        black: pygame.Color = pygame.Color("black")
+        if not covered:
+            surface.fill(black)
+            return
+        # strips above and below span the viewport, left and right fill the gap
+        surface.fill(
+            black, (viewport.x, viewport.y, viewport.width, covered.y - viewport.y)
+        )
+        surface.fill(
+            black,
+            (
+                viewport.x,
+                covered.bottom,
+                viewport.width,
+                viewport.bottom - covered.bottom,
+            ),
+        )
+        surface.fill(
+            black, (viewport.x, covered.y, covered.x - viewport.x, covered.height)
+        )
+        surface.fill(
+            black,
+            (covered.right, covered.y, viewport.right - covered.right, covered.height),
+        )
+
+    def _move_against_player(
+        self, sprite: Tile, camera_compass: pygame.math.Vector2, speed: int
+    ) -> None:
+        """Move a sprite in the opposite direction of the player's heading.
+
+        Tile.move only reads the compass, so the sprite's own compass is swapped
+        out and back without copying either vector.
+
+        Parameters
+        ----------
+        sprite: Tile
+            The sprite to move
+        camera_compass: pygame.math.Vector2
+            The opposite of the player's heading
+        speed: int
+            The player's speed
+        """
+        previous_direction: pygame.math.Vector2 = sprite.compass
+        sprite.compass = camera_compass
+        sprite.move(speed)
+        sprite.compass = previous_direction
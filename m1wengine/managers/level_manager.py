@@ -59,7 +59,6 @@ class LevelManager:
         self._asset_manager.load_music("menu", "main_menu")
         self._level: object = object()
 
-        self._user_input: str = "None"
         # quit flag returned to game
         self._quit_game: bool = False
 
@@ -94,12 +93,12 @@ class LevelManager:
             self._menu.run()
         self._user_input = self._menu.user_selection
 
-        if self._user_input == UserSelection.level:
+        if self._user_input is UserSelection.level:
             # check is menu is finished disabling
             if not self._menu.is_enabled():
                 self._level.run()
-        elif self._user_input == UserSelection.quit:
-            self._quit_game is not self._quit_game
+        elif self._user_input is UserSelection.quit:
+            self._quit_game = True
 
         self._clock.tick(FPS)
         return self._quit_game
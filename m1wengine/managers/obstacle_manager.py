@@ -0,0 +1,159 @@
+"""This module contains the ObstacleManager class."""
+import pygame
+from m1wengine.settings import TILESIZE
+
+
+class ObstacleManager(pygame.sprite.Group):
+    """Obstacle Manager class.
+
+    Sprite group for static obstacles such as fences. Every obstacle is bucketed
+    into a grid of tile sized cells, so collision checks only look at the
+    obstacles in the cells an entity overlaps instead of every obstacle in the
+    level. Tiles join their groups before their rect is set, so new obstacles are
+    only bucketed on the next lookup.
+
+    Obstacles must only be moved by the camera. The camera moves every obstacle
+    the same way, but each obstacle tracks its own sub pixel movement, so one
+    obstacle's distance moved can differ from another's by up to a camera step of
+    the player's speed. Lookups are padded by a full cell to cover this.
+
+    Attributes
+    ----------
+    _cells: dict[tuple[int, int], list[pygame.sprite.Sprite]]
+        The obstacles overlapping each grid cell
+    _world_rects: dict[pygame.sprite.Sprite, pygame.Rect]
+        The rect of each obstacle with the camera movement removed
+    _unindexed: dict[pygame.sprite.Sprite, None]
+        The obstacles added since the last lookup, in insertion order
+
+    Methods
+    -------
+    sprites_near(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]
+        Get the obstacles in the grid cells overlapped by a rect
+    add_internal(self, sprite: pygame.sprite.Sprite, layer=None)
+        Add an obstacle to the group
+    remove_internal(self, sprite: pygame.sprite.Sprite)
+        Remove an obstacle from the group and the grid
+    _index_new_obstacles(self)
+        Bucket the obstacles added since the last lookup into the grid
+    _camera_drift(self) -> tuple[int, int]
+        Get how far the camera has moved the obstacles
+    _cells_overlapping(self, rect: pygame.Rect) -> list[tuple[int, int]]
+        Get the grid cells overlapped by a rect
+    """
+
+    def __init__(self, *sprites: pygame.sprite.Sprite) -> None:
+        """Construct an ObstacleManager object.
+
+        Parameters
+        ----------
+        sprites: pygame.sprite.Sprite
+            The obstacles to start with
+        """
+        self._cells: dict[tuple[int, int], list[pygame.sprite.Sprite]] = {}
+        self._world_rects: dict[pygame.sprite.Sprite, pygame.Rect] = {}
+        self._unindexed: dict[pygame.sprite.Sprite, None] = {}
+        super().__init__(*sprites)
+
+    def sprites_near(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Get the obstacles in the grid cells overlapped by a rect.
+
+        Every obstacle colliding with the rect is returned, along with the ones
+        within about a cell of it.
+
+        Parameters
+        ----------
+        rect: pygame.Rect
+            The screen space rect to look around
+
+        Returns
+        -------
+        list[pygame.sprite.Sprite]
+            The nearby obstacles, without duplicates
+        """
+        self._index_new_obstacles()
+        drift_x, drift_y = self._camera_drift()
+        # pad by a cell, obstacles added mid level may be a camera step of the
+        # player's speed out from the drift measured on the first obstacle
+        world_rect: pygame.Rect = rect.move(-drift_x, -drift_y).inflate(
+            2 * TILESIZE, 2 * TILESIZE
+        )
+
+        nearby: dict[pygame.sprite.Sprite, None] = {}
+        for cell in self._cells_overlapping(world_rect):
+            nearby.update(dict.fromkeys(self._cells.get(cell, ())))
+        return list(nearby)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer=None) -> None:
+        """Add an obstacle to the group.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The obstacle to add
+        layer: None
+            Unused, kept to match pygame.sprite.Group.add_internal
+        """
+        super().add_internal(sprite, layer)
+        self._unindexed[sprite] = None
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove an obstacle from the group and the grid.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The obstacle to remove
+        """
+        super().remove_internal(sprite)
+        if sprite in self._unindexed:
+            del self._unindexed[sprite]
+            return
+        world_rect: pygame.Rect = self._world_rects.pop(sprite)
+        for cell in self._cells_overlapping(world_rect):
+            self._cells[cell].remove(sprite)
+
+    def _index_new_obstacles(self) -> None:
+        """Bucket the obstacles added since the last lookup into the grid."""
+        drift_x, drift_y = self._camera_drift()
+        for sprite in self._unindexed:
+            world_rect: pygame.Rect = sprite.rect.move(-drift_x, -drift_y)
+            self._world_rects[sprite] = world_rect
+            for cell in self._cells_overlapping(world_rect):
+                self._cells.setdefault(cell, []).append(sprite)
+        self._unindexed.clear()
+
+    def _camera_drift(self) -> tuple[int, int]:
+        """Get how far the camera has moved the obstacles.
+
+        Returns
+        -------
+        tuple[int, int]
+            The x and y distance moved since the first obstacles were bucketed
+        """
+        for sprite, world_rect in self._world_rects.items():
+            return (sprite.rect.x - world_rect.x, sprite.rect.y - world_rect.y)
+        return (0, 0)
+
+    def _cells_overlapping(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        """Get the grid cells overlapped by a rect.
+
+        Parameters
+        ----------
+        rect: pygame.Rect
+            The world space rect to find cells for
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The (column, row) of each overlapped cell
+        """
+        first_col: int = rect.left // TILESIZE
+        last_col: int = (rect.right - 1) // TILESIZE
+        first_row: int = rect.top // TILESIZE
+        last_row: int = (rect.bottom - 1) // TILESIZE
+        return [
+            (col, row)
+            for col in range(first_col, last_col + 1)
+            for row in range(first_row, last_row + 1)
+        ]
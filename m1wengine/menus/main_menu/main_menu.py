@@ -1,9 +1,36 @@
 """This module contains the MainMenu class."""
+from functools import cache
 import pygame
 import pygame_menu
 from m1wengine.settings import WINDOW_WIDTH, WINDOW_HEIGHT, MAIN_MENU_BACKGROUND_PATH
 from m1wengine.enums.user_selection import UserSelection
 
+# (label, difficulty) pairs shown by the difficulty selector
+_DIFFICULTY_CHOICES: tuple[tuple[str, int], ...] = (
+    ("EASY", 0),
+    ("NORMAL", 1),
+    ("HARD", 2),
+)
+
+
+@cache
+def _get_menu_image(path: str) -> pygame.Surface:
+    """Load a menu image once in the display pixel format.
+
+    The display mode must be set before the first call for each path.
+
+    Parameters
+    ----------
+    path: str
+        The filepath of the image
+
+    Returns
+    -------
+    pygame.Surface
+        The converted image, shared by every menu using it
+    """
+    return pygame.image.load(path).convert()
+
 
 class MainMenu(pygame_menu.Menu):
     """Main Menu Level.
@@ -17,7 +44,7 @@ class MainMenu(pygame_menu.Menu):
         The background image for the main menu
     _display_surface: pygame.Surface
         The surface window the game is rendered on
-    _user_selection: str
+    _user_selection: UserSelection
         Exit condition flag returned to LevelManager
 
     Methods
@@ -41,14 +68,15 @@ class MainMenu(pygame_menu.Menu):
     def __init__(self) -> None:
         """Construct the main menu class.
 
-        This method will instantiate all required sprite groups for the main menu level
+        This method will instantiate all required sprite groups for the main menu level.
+        The display mode must be set first, since the background image is converted
+        to the display pixel format the first time a menu is made.
         """
-        self._menu_image: pygame.Surface = pygame.image.load(MAIN_MENU_BACKGROUND_PATH)
+        self._menu_image: pygame.Surface = _get_menu_image(MAIN_MENU_BACKGROUND_PATH)
         super().__init__("Main Menu", WINDOW_WIDTH, WINDOW_HEIGHT)
         self._display_surface: pygame.Surface = pygame.display.get_surface()
         # create pygame_menu options for the main menu
         self.add_menu_options()
-        # TODO: self._user_selection should be Enum
         self._user_selection: UserSelection = UserSelection.none
 
     @property
@@ -82,10 +110,10 @@ class MainMenu(pygame_menu.Menu):
         """Add all menu options to the main menu."""
         # add 'Play' button to load a level
         self.add.button(title="Play", action=self.start_game)
-        # add a difficulty selector
+        # add a difficulty selector, pygame_menu copies its items so needs a list
         self.add.selector(
             "Difficulty: ",
-            [("EASY", 0), ("NORMAL", 1), ("HARD", 2)],
+            list(_DIFFICULTY_CHOICES),
             onchange=self.set_difficulty,
         )
         # add 'Quit' button
@@ -31,6 +31,14 @@ class ScoreController(object):
         Get the boredom meter
     boredom_meter(self, new_value)
         Set the boredom meter
+    on_skeleton_death(self)
+        Update the scores for a destroyed skeleton
+    on_damsel_death(self)
+        Update the scores for a destroyed damsel
+    bad_entity_destroyed_update_score(self, entity_name: str)
+        Update the scores for a destroyed bad entity by name
+    good_entity_destroyed_update_score(self, entity_name: str)
+        Update the scores for a destroyed good entity by name
     """
 
     def __new__(cls):
@@ -45,7 +53,14 @@ class ScoreController(object):
     def __init__(
         self,
     ):
-        """Construct the first singleton instance."""
+        """Construct the first singleton instance.
+
+        Every ScoreController() call runs __init__ on the singleton, so later calls
+        return straight away instead of resetting the scores.
+        """
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized: bool = True
         self._current_score: int = 0
         self._boredom_meter: int = 0
 
@@ -87,25 +102,37 @@ class ScoreController(object):
         else:
             raise ValueError("Boredom meter cannot be a negative value.")
 
+    def on_skeleton_death(self) -> None:
+        """Update meta data on a skeleton destroyed."""
+        # only ever increases, so the setters' negative value checks are skipped
+        self._current_score += SCORE_INCREASE_SKELETON_DEATH
+        self._boredom_meter += BOREDOM_INCREASE_SKELETON_DEATH
+
+    def on_damsel_death(self) -> None:
+        """Update meta data on a damsel destroyed."""
+        # clamped at 0, so the setters' negative value checks can be skipped
+        self._current_score = max(0, self._current_score - SCORE_REDUCE_DAMSEL_DEATH)
+        self._boredom_meter = max(0, self._boredom_meter - BOREDOM_REDUCE_DAMSEL_DEATH)
+
     def bad_entity_destroyed_update_score(self, entity_name: str):
         """Update meta data on bad entity destroyed.
 
-        Checks each individual entity when making updates.
+        Checks each individual entity when making updates. Callers that know the
+        entity should call its on_<entity>_death method instead.
 
         Parameters
         ----------
         entity_name: str
             The name of the entity
         """
-        check = entity_name
-        if check == "Skeleton":
-            self.current_score += SCORE_INCREASE_SKELETON_DEATH
-            self.boredom_meter += BOREDOM_INCREASE_SKELETON_DEATH
+        if entity_name == "Skeleton":
+            self.on_skeleton_death()
 
     def good_entity_destroyed_update_score(self, entity_name: str):
         """Update meta data on good entity destroyed.
 
-        Checks each individual entity when making updates.
+        Checks each individual entity when making updates. Callers that know the
+        entity should call its on_<entity>_death method instead.
 
         Parameters
         ----------
@@ -113,12 +140,4 @@ class ScoreController(object):
             The name of the entity
         """
         if entity_name == "Damsel":
-            if self.current_score - SCORE_REDUCE_DAMSEL_DEATH < 0:
-                self.current_score = 0
-            else:
-                self.current_score -= SCORE_REDUCE_DAMSEL_DEATH
-
-            if self.boredom_meter - BOREDOM_REDUCE_DAMSEL_DEATH < 0:
-                self.boredom_meter = 0
-            else:
-                self.boredom_meter -= BOREDOM_REDUCE_DAMSEL_DEATH
+            self.on_damsel_death()
@@ -49,13 +49,18 @@ class Text(pygame.sprite.Sprite):
     def text_string(self, new_value) -> None:
         """Set the text string value.
 
+        The text is only rendered again when the string changes, so values that
+        are set every frame cost a compare instead of a font render.
+
         Parameters
         ----------
         new_value: int
             New incoming value to set
         """
-        self._text = str(new_value)
-        self.render_font()
+        new_text: str = str(new_value)
+        if new_text != self._text:
+            self._text = new_text
+            self.render_font()
 
     def render_font(self) -> None:
         """Set the current font for rendering."""
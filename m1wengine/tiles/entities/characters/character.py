@@ -232,11 +232,8 @@ class Character(Entity):
         hypotenuse: float
             The distance the coordinates are from this character
         """
-        x: int = 0
-        y: int = 1
-        hypotenuse: float = math.hypot(
-            coords[x] - self.rect[x], coords[y] - self.rect[y]
-        )
+        coord_x, coord_y = coords
+        hypotenuse: float = math.hypot(coord_x - self.rect.x, coord_y - self.rect.y)
         return hypotenuse
 
     def set_image_rotation(self, image: pygame.Surface) -> pygame.Surface:
@@ -287,14 +284,17 @@ class Character(Entity):
             All the collision information between this sprite and a group.
         """
         # get list of sprites from the passed in sprite group
-        obstacle_sprites: list = sprite_group.sprites()
+        sprites_near: callable = getattr(sprite_group, "sprites_near", None)
+        if sprites_near is not None:
+            # groups such as ObstacleManager only return the sprites around self
+            obstacle_sprites: list = sprites_near(self.rect)
+        else:
+            obstacle_sprites: list = sprite_group.sprites()
         # extract list of rects from obstacle_sprites
-        sprite_rects: list[pygame.Rect] = list()
-        for sprite in obstacle_sprites:
-            sprite_rects.append(sprite.rect)
+        sprite_rects: list[pygame.Rect] = [sprite.rect for sprite in obstacle_sprites]
 
         # list of all obstacle sprite indicies player has collisions with
-        collision_indicies: list[int] = self.rect.collidelistall(obstacle_sprites)
+        collision_indicies: list[int] = self.rect.collidelistall(sprite_rects)
 
         left_coords: list = []
         right_coords: list = []
@@ -392,8 +392,9 @@ class Character(Entity):
         further: str
             The string of the further axis away from our coords
         """
-        distance_to_x: float = abs(self.rect.centerx - coord[0])
-        distance_to_y: float = abs(self.rect.centery - coord[1])
+        coord_x, coord_y = coord
+        distance_to_x: float = abs(self.rect.centerx - coord_x)
+        distance_to_y: float = abs(self.rect.centery - coord_y)
         further: str = "vertical"
         if distance_to_x > distance_to_y:
             further = "horizontal"
@@ -420,11 +421,11 @@ class Character(Entity):
             if "collision" not in key:
                 coord_tuple_list: list = collision_coordinates[key]
 
-                for coord_tuple in coord_tuple_list:
+                for coord_x, coord_y in coord_tuple_list:
                     count += 1
                     # sum all collision
-                    collision_point_x += coord_tuple[0]
-                    collision_point_y += coord_tuple[1]
+                    collision_point_x += coord_x
+                    collision_point_y += coord_y
 
         # divide by number of collisions
         if count != 0:
@@ -463,10 +464,11 @@ class Character(Entity):
             0, Direction.down
         )
 
-        abs_distance_to_x: int = abs(self.rect.centerx - collided_coords[0])
-        abs_distance_to_y: int = abs(self.rect.centery - collided_coords[1])
-        distance_to_x: int = collided_coords[0] - self.rect.centerx
-        distance_to_y: int = collided_coords[1] - self.rect.centery
+        collided_x, collided_y = collided_coords
+        abs_distance_to_x: int = abs(self.rect.centerx - collided_x)
+        abs_distance_to_y: int = abs(self.rect.centery - collided_y)
+        distance_to_x: int = collided_x - self.rect.centerx
+        distance_to_y: int = collided_y - self.rect.centery
 
         # if to the left or right
         if abs_distance_to_x > abs_distance_to_y:
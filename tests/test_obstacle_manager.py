@@ -0,0 +1,86 @@
+"""Check ObstacleManager lookups against a brute force search."""
+import os
+import random
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from m1wengine.managers.camera_manager import CameraManager  # noqa: E402
+from m1wengine.managers.obstacle_manager import ObstacleManager  # noqa: E402
+from m1wengine.settings import TILESIZE  # noqa: E402
+from m1wengine.tiles.tile import Tile  # noqa: E402
+
+
+class FakePlayer:
+    """Stand in for the Player, the camera only reads its compass and speed."""
+
+    def __init__(self, compass: pygame.math.Vector2, speed: int) -> None:
+        """Set the heading and speed the camera moves against."""
+        self.compass: pygame.math.Vector2 = compass
+        self.speed: int = speed
+
+
+class TestObstacleManager(unittest.TestCase):
+    """Compare sprites_near with checking every obstacle."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set a display mode, the camera reads the display size."""
+        pygame.init()
+        pygame.display.set_mode((320, 240))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Close the display."""
+        pygame.quit()
+
+    def test_sprites_near_finds_every_colliding_obstacle(self) -> None:
+        """Obstacles added while the camera moves are never missed."""
+        rng: random.Random = random.Random(1)
+        image: pygame.Surface = pygame.Surface((TILESIZE, TILESIZE))
+        for _ in range(100):
+            compass: pygame.math.Vector2 = pygame.math.Vector2(
+                rng.uniform(-1, 1), rng.uniform(-1, 1)
+            )
+            camera: CameraManager = CameraManager(
+                FakePlayer(compass, rng.randint(1, 6))
+            )
+            obstacles: ObstacleManager = ObstacleManager()
+            # add obstacles on cell boundaries between camera steps
+            for _ in range(6):
+                obstacle: Tile = Tile([camera, obstacles])
+                obstacle.set_tile(
+                    (rng.randint(0, 19) * TILESIZE, rng.randint(0, 14) * TILESIZE),
+                    image,
+                )
+                obstacles.sprites_near(obstacle.rect)
+                for _ in range(rng.randint(0, 12)):
+                    camera.camera_update()
+
+            for obstacle in obstacles:
+                for _ in range(20):
+                    probe: pygame.Rect = pygame.Rect(
+                        obstacle.rect.x + rng.randint(-15, 15),
+                        obstacle.rect.y + rng.randint(-19, 19),
+                        16,
+                        20,
+                    )
+                    colliding: set = {
+                        sprite for sprite in obstacles if sprite.rect.colliderect(probe)
+                    }
+                    self.assertLessEqual(colliding, set(obstacles.sprites_near(probe)))
+
+    def test_removed_obstacles_are_not_returned(self) -> None:
+        """Killed obstacles leave the grid."""
+        obstacles: ObstacleManager = ObstacleManager()
+        image: pygame.Surface = pygame.Surface((TILESIZE, TILESIZE))
+        fence: Tile = Tile(obstacles)
+        fence.set_tile((32, 32), image)
+        self.assertIn(fence, obstacles.sprites_near(fence.rect))
+        fence.kill()
+        self.assertNotIn(fence, obstacles.sprites_near(fence.rect))
+
+
+if __name__ == "__main__":
+    unittest.main()